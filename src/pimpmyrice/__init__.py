@@ -1,7 +1,15 @@
-from importlib.metadata import version
+from typing import Any
 
 from pimpmyrice.logger import set_up_logging
 
-__version__ = version("pimpmyrice")
+
+def __getattr__(name: str) -> Any:
+    # resolving the installed version reads package metadata, only do it on demand
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version("pimpmyrice")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 set_up_logging()
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from functools import cache
 from pathlib import Path
@@ -8,60 +9,240 @@ from numpy.typing import NDArray
 from PIL import Image
 
 from pimpmyrice.colors import Color
+from pimpmyrice.config_paths import EXTRACTED_COLORS_DIR
+from pimpmyrice.files import load_json, save_json
 
 log = logging.getLogger(__name__)
 
+# bump when a change to the extraction makes cached results stale
+EXTRACTION_VERSION = 4
+
+# sRGB (D65) <-> CIE XYZ
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ],
+    dtype=np.float64,
+)
+_XYZ_TO_RGB = np.linalg.inv(_RGB_TO_XYZ)
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883], dtype=np.float64)
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+
+
+def srgb_to_lab(rgb: NDArray[Any]) -> NDArray[np.float64]:
+    """
+    Convert 0–255 sRGB colors to CIELAB (D65).
+
+    Args:
+        rgb (NDArray[Any]): (N, 3) array of RGB colors.
+
+    Returns:
+        NDArray[np.float64]: (N, 3) array of L*, a*, b*.
+    """
+    # float64 so in-gamut colors survive the round trip back to sRGB
+    c = np.asarray(rgb, dtype=np.float64) / 255
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    t = (linear @ _RGB_TO_XYZ.T) / _D65_WHITE
+    f = np.where(t > _LAB_EPSILON, np.cbrt(t), (_LAB_KAPPA * t + 16) / 116)
+
+    lab = np.empty_like(f)
+    lab[:, 0] = 116 * f[:, 1] - 16
+    lab[:, 1] = 500 * (f[:, 0] - f[:, 1])
+    lab[:, 2] = 200 * (f[:, 1] - f[:, 2])
+    return lab
+
+
+def lab_to_srgb(lab: NDArray[Any]) -> NDArray[np.float64]:
+    """
+    Convert CIELAB (D65) colors to 0–255 sRGB, clipped to the gamut.
+
+    Args:
+        lab (NDArray[Any]): (N, 3) array of L*, a*, b*.
+
+    Returns:
+        NDArray[np.float64]: (N, 3) array of RGB colors.
+    """
+    lab = np.asarray(lab, dtype=np.float64)
+    f = np.empty_like(lab)
+    f[:, 1] = (lab[:, 0] + 16) / 116
+    f[:, 0] = f[:, 1] + lab[:, 1] / 500
+    f[:, 2] = f[:, 1] - lab[:, 2] / 200
+
+    f3 = f**3
+    t = np.where(f3 > _LAB_EPSILON, f3, (116 * f - 16) / _LAB_KAPPA)
+    linear = np.clip((t * _D65_WHITE) @ _XYZ_TO_RGB.T, 0, 1)
+    c = np.where(
+        linear <= 0.0031308, 12.92 * linear, 1.055 * linear ** (1 / 2.4) - 0.055
+    )
+    return np.asarray(np.clip(c * 255, 0, 255), dtype=np.float64)
+
+
+def quantize_pixels(
+    pixels: NDArray[np.uint8], bits: int = 4
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """
+    Bucket RGB pixels into a (2^bits)^3 histogram.
+
+    Args:
+        pixels (NDArray[np.uint8]): Array of RGB pixels.
+        bits (int): Bits kept per channel. Defaults to 4 (4096 bins).
+
+    Returns:
+        tuple[NDArray[np.float32], NDArray[np.float32]]: Mean color and pixel
+            count of each non-empty bin.
+    """
+    shift = 8 - bits
+    q = (pixels >> shift).astype(np.int32)
+    keys = (q[:, 0] << (2 * bits)) | (q[:, 1] << bits) | q[:, 2]
+
+    num_bins = 1 << (3 * bits)
+    counts = np.bincount(keys, minlength=num_bins)
+    nz = counts > 0
+
+    means = np.empty((int(nz.sum()), 3), dtype=np.float32)
+    for c in range(3):
+        sums = np.bincount(keys, weights=pixels[:, c], minlength=num_bins)
+        means[:, c] = sums[nz] / counts[nz]
+
+    return means, counts[nz].astype(np.float32)
+
+
+def _kmeanspp_init(
+    points: NDArray[np.float32],
+    weights: NDArray[np.float32],
+    num_clusters: int,
+    rng: np.random.Generator,
+) -> NDArray[np.float32]:
+    """
+    Pick initial centers with k-means++ (D^2 weighted) sampling.
+
+    Args:
+        points (NDArray[np.float32]): Array of RGB points.
+        weights (NDArray[np.float32]): Per-point weights.
+        num_clusters (int): Number of centers to pick.
+        rng (np.random.Generator): Random generator.
+
+    Returns:
+        NDArray[np.float32]: (num_clusters, 3) initial centers.
+    """
+    n = len(points)
+    weights_64 = weights.astype(np.float64)
+
+    centers = np.empty((num_clusters, 3), dtype=np.float32)
+    centers[0] = points[rng.choice(n, p=weights_64 / weights_64.sum())]
+    min_d2 = ((points - centers[0]) ** 2).sum(axis=1, dtype=np.float64)
+
+    for i in range(1, num_clusters):
+        probs = weights_64 * min_d2
+        total = probs.sum()
+        # fewer distinct points than clusters, any pick is as good
+        idx = rng.choice(n, p=probs / total) if total > 0 else rng.choice(n)
+        centers[i] = points[idx]
+        min_d2 = np.minimum(
+            min_d2, ((points - centers[i]) ** 2).sum(axis=1, dtype=np.float64)
+        )
+
+    return centers
+
 
 def kmeans(
-    pixels: NDArray[np.uint8],
+    pixels: NDArray[Any],
     num_clusters: int = 6,
-    max_iter: int = 100,
+    max_iter: int = 20,
     tol: float = 1e-4,
+    weights: NDArray[Any] | None = None,
+    lab: bool = False,
 ) -> list[tuple[tuple[int, int, int], int]]:
     """
     K-means over RGB pixels returning cluster centers and sizes.
 
     Args:
-        pixels (NDArray[np.uint8]): Array of RGB pixels.
+        pixels (NDArray[Any]): Array of RGB pixels.
         num_clusters (int): Number of clusters. Defaults to 6.
-        max_iter (int): Max iterations. Defaults to 100.
-        tol (float): Convergence threshold. Defaults to 1e-4.
+        max_iter (int): Max iterations. Defaults to 20.
+        tol (float): Convergence threshold, relative to the pixels variance.
+            Defaults to 1e-4.
+        weights (NDArray[Any] | None): Per-pixel weights, e.g. histogram
+            counts. Defaults to None (all pixels weigh 1).
+        lab (bool): Cluster in CIELAB, where distances follow perceived color
+            differences. Input and returned centers stay RGB. Defaults to False.
 
     Returns:
         list[tuple[tuple[int, int, int], int]]: (center RGB, count) pairs.
     """
-    np.random.seed(42)
-    indices = np.random.choice(len(pixels), num_clusters, replace=False)
-    cluster_centers = pixels[indices]
+    # float32 throughout: plenty for 8-bit color, half the memory traffic
+    points: NDArray[np.float32] = np.ascontiguousarray(
+        srgb_to_lab(pixels) if lab else pixels, dtype=np.float32
+    )
+    w: NDArray[np.float32] = (
+        np.ones(len(points), dtype=np.float32)
+        if weights is None
+        else np.ascontiguousarray(weights, dtype=np.float32)
+    )
+    weighted_points = points * w[:, np.newaxis]
+    # ||p - c||^2 = ||p||^2 - 2 p.c + ||c||^2, and ||p||^2 is the same for every
+    # center so it doesn't affect the argmin: one matrix product into a reused
+    # buffer is all the assignment step needs
+    distances = np.empty((len(points), num_clusters), dtype=np.float32)
+
+    # local generator: deterministic results without touching numpy's global state
+    rng = np.random.default_rng(42)
+    cluster_centers = _kmeanspp_init(points, w, num_clusters, rng=rng)
+
+    # sklearn-style tolerance: relative to the data variance, compared
+    # against the squared centers shift
+    mean = np.average(points, axis=0, weights=w)
+    var = np.average((points - mean) ** 2, axis=0, weights=w)
+    tol_scaled = tol * float(var.mean())
+    prev_labels = None
 
     for iteration in range(max_iter):
-        distances = np.linalg.norm(pixels[:, np.newaxis] - cluster_centers, axis=2)
-        labels = np.argmin(distances, axis=1)
+        c_sq = np.einsum("ij,ij->i", cluster_centers, cluster_centers)
+        np.dot(points, -2.0 * cluster_centers.T, out=distances)
+        distances += c_sq
+        labels = distances.argmin(axis=1)
 
-        new_cluster_centers: Any = []
-        cluster_sizes = []
+        if prev_labels is not None and np.array_equal(labels, prev_labels):
+            break
+        prev_labels = labels
 
-        for k in range(num_clusters):
-            cluster_pixels = pixels[labels == k]
-            if len(cluster_pixels) == 0:
-                new_center = pixels[np.random.choice(len(pixels))]
-            else:
-                new_center = cluster_pixels.mean(axis=0)
-            new_cluster_centers.append(new_center)
-            cluster_sizes.append(len(cluster_pixels))
+        # one scatter-add pass per channel instead of a boolean mask per cluster
+        counts = np.bincount(labels, weights=w, minlength=num_clusters)
+        new_cluster_centers = np.empty((num_clusters, 3), dtype=np.float32)
+        for c in range(3):
+            new_cluster_centers[:, c] = np.bincount(
+                labels, weights=weighted_points[:, c], minlength=num_clusters
+            )
+        new_cluster_centers /= np.where(counts > 0, counts, 1)[:, np.newaxis]
 
-        new_cluster_centers = np.array(new_cluster_centers)
+        empty = counts == 0
+        if empty.any():
+            new_cluster_centers[empty] = points[
+                rng.integers(len(points), size=int(empty.sum()))
+            ]
+        cluster_sizes = np.rint(counts).astype(int).tolist()
 
-        if np.linalg.norm(new_cluster_centers - cluster_centers) < tol:
-            break
+        shift_sq = float(((new_cluster_centers - cluster_centers) ** 2).sum())
         cluster_centers = new_cluster_centers
+        if shift_sq <= tol_scaled:
+            break
 
-    sorted_clusters = sorted(
-        zip(cluster_centers, cluster_sizes), key=lambda x: x[1], reverse=True
-    )
+    centers_rgb = lab_to_srgb(cluster_centers) if lab else cluster_centers
+
+    # biggest first, ties keep their cluster order
+    order = np.argsort(-np.asarray(cluster_sizes), kind="stable")
+    # round, truncating turns e.g. 254.9999 into 254
+    centers_int = np.rint(centers_rgb).astype(np.int32)
 
     sorted_cluster_centers = [
-        (tuple(center.astype(int)), size) for center, size in sorted_clusters
+        (
+            (int(centers_int[i, 0]), int(centers_int[i, 1]), int(centers_int[i, 2])),
+            cluster_sizes[i],
+        )
+        for i in order
     ]
 
     return sorted_cluster_centers
@@ -77,27 +258,69 @@ def extract_colors(
     Args:
         image_path (Path): Path to the image.
         num_colors (int): Number of colors to extract. Defaults to 6.
-        resize_to_size (int): Resize longest side to this many px. Defaults to 300.
+        resize_to_size (int): Shrink longest side to this many px. Defaults to 300.
 
     Returns:
         list[tuple[Color, int]]: Colors and their approximate counts.
     """
-    img = Image.open(image_path).convert("RGB")
+    cache_file = EXTRACTED_COLORS_DIR / (
+        f"{image_cache_key(image_path, num_colors, resize_to_size)}.json"
+    )
+    if cache_file.is_file():
+        try:
+            cached = load_json(cache_file)["colors"]
+            log.debug(f'extracted colors for "{image_path}" loaded from cache')
+            return [(Color(color), count) for color, count in cached]
+        except Exception as e:
+            log.debug(f'invalid colors cache "{cache_file}": {e}')
 
-    width, height = img.size
-    resize_factor = resize_to_size / max(width, height)
-    new_width, new_height = (int(width * resize_factor), int(height * resize_factor))
-    img = img.resize((new_width, new_height))
+    target = (resize_to_size, resize_to_size)
+    with Image.open(image_path) as img:
+        # lets libjpeg decode straight at 1/2, 1/4 or 1/8 scale, no-op otherwise
+        img.draft("RGB", target)
+        img.thumbnail(target, Image.Resampling.BOX)
+        img_array: NDArray[np.uint8] = np.array(img.convert("RGB"))
 
-    img_array: NDArray[np.uint8] = np.array(img)
     pixels: NDArray[np.uint8] = img_array.reshape(-1, 3)
 
-    rgb_with_count = kmeans(pixels, num_clusters=num_colors)
+    # at most 4096 distinct colors left to cluster, weighted by pixel count
+    bins, bin_counts = quantize_pixels(pixels)
+    rgb_with_count = kmeans(bins, num_clusters=num_colors, weights=bin_counts, lab=True)
     colors_with_count = [(Color(rgb), count) for rgb, count in rgb_with_count]
 
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        save_json(
+            cache_file,
+            {"colors": [[color.hex, count] for color, count in colors_with_count]},
+        )
+    except OSError as e:
+        log.debug(f'failed to write colors cache "{cache_file}": {e}')
+
     return colors_with_count
 
 
+def image_cache_key(image_path: Path, *params: int) -> str:
+    """
+    Cache key for an image, from its first 64 KiB, size, mtime and `params`.
+
+    Args:
+        image_path (Path): Path to the image.
+        *params (int): Extraction parameters that affect the result.
+
+    Returns:
+        str: Hex digest.
+    """
+    stat = image_path.stat()
+    h = hashlib.blake2b(digest_size=16)
+    with open(image_path, "rb") as f:
+        h.update(f.read(65536))
+    h.update(
+        f"{stat.st_size}|{stat.st_mtime_ns}|{EXTRACTION_VERSION}|{params}".encode()
+    )
+    return h.hexdigest()
+
+
 # def are_hues_close(hue1: float, hue2: float, tolerance: int = 30) -> bool:
 #     if abs(hue1 - hue2) < tolerance:
 #         return True
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import colorsys
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Generic, TypeVar, overload
 
 from pydantic import BaseModel, Field, GetJsonSchemaHandler
 from pydantic.json_schema import JsonSchemaValue, SkipJsonSchema
@@ -14,6 +15,145 @@ from pimpmyrice.files import load_json
 
 log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=4096)
+def _hsv_to_rgb(h: int, s: int, v: int) -> tuple[float, float, float]:
+    """
+    Convert integer HSV to normalized RGB.
+
+    Palettes are built from a small set of quantized HSV values, so results
+    are cached.
+
+    Args:
+        h (int): Hue in degrees.
+        s (int): Saturation in percent.
+        v (int): Value in percent.
+
+    Returns:
+        tuple[float, float, float]: Normalized RGB.
+    """
+    return colorsys.hsv_to_rgb(h / 360, s / 100, v / 100)
+
+
+def _rgb_to_hsv(r: float, g: float, b: float) -> tuple[float, float, float]:
+    """
+    Convert normalized RGB to normalized HSV.
+
+    Same arithmetic as `colorsys.rgb_to_hsv` (results are bit-identical), but
+    only the two channel distances the hue sector needs are computed.
+
+    Args:
+        r (float): Red in [0.0, 1.0].
+        g (float): Green in [0.0, 1.0].
+        b (float): Blue in [0.0, 1.0].
+
+    Returns:
+        tuple[float, float, float]: (h, s, v) in [0.0, 1.0].
+    """
+    # conditional expressions instead of max()/min(): no call, no tuple packing
+    maxc = r if r > g else g
+    maxc = maxc if maxc > b else b
+    minc = r if r < g else g
+    minc = minc if minc < b else b
+    delta = maxc - minc
+    if delta == 0:
+        return 0.0, 0.0, maxc
+
+    if r == maxc:
+        h = (maxc - b) / delta - (maxc - g) / delta
+    elif g == maxc:
+        h = 2.0 + (maxc - r) / delta - (maxc - b) / delta
+    else:
+        h = 4.0 + (maxc - g) / delta - (maxc - r) / delta
+
+    return (h / 6.0) % 1.0, delta / maxc, maxc
+
+
+def _to_byte(c: float) -> int:
+    """Normalized channel to a 0–255 int, rounded and clamped."""
+    return min(255, max(0, round(c * 255)))
+
+
+def _adjust_channel(
+    value: int,
+    adjustment: int | str | None,
+    min_val: int | None,
+    max_val: int | None,
+    wrap_basis: int | None = None,
+) -> int:
+    """
+    Apply an `adjusted()` change to a single HSV(A) channel.
+
+    Args:
+        value (int): Current channel value.
+        adjustment (int | str | None): Absolute value, "+N"/"-N", or None.
+        min_val (int | None): Lower clamp.
+        max_val (int | None): Upper clamp.
+        wrap_basis (int | None): Wrap around this value (hue). Defaults to
+            None, clamping to [0, 100].
+
+    Returns:
+        int: Adjusted channel value.
+    """
+    if isinstance(adjustment, str):
+        if adjustment.startswith("+"):
+            value += int(adjustment[1:])
+        elif adjustment.startswith("-"):
+            value -= int(adjustment[1:])
+        else:
+            raise ValueError(f'invalid adjustment format: "{adjustment}"')
+    elif isinstance(adjustment, int):
+        value = adjustment
+
+    if min_val is not None:
+        value = max(min_val, value)
+    if max_val is not None:
+        value = min(max_val, value)
+
+    if wrap_basis:
+        value %= wrap_basis
+        return max(0, min(wrap_basis, value))
+    else:
+        return max(0, min(100, value))
+
+
+class _slot_cached_property(Generic[_T]):
+    """
+    `functools.cached_property` for classes with `__slots__`.
+
+    The value is stored in the `_<name>_cache` slot, which the owner class
+    must declare.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name.lstrip('_')}_cache"
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> _slot_cached_property[_T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T: ...
+
+    def __get__(
+        self, instance: object | None, owner: type | None = None
+    ) -> _T | _slot_cached_property[_T]:
+        if instance is None:
+            return self
+        try:
+            value: _T = getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+        return value
+
 
 class Color:
     """
@@ -23,6 +163,15 @@ class Color:
     or another Color. `_rgba` is internal; use public APIs.
     """
 
+    __slots__ = (
+        "_rgba",
+        "_hex_cache",
+        "_hexa_cache",
+        "_rgba8_cache",
+        "_hsl_cache",
+        "_hsv_cache",
+    )
+
     _rgba: tuple[float, float, float, float]
 
     def __init__(self, value: str | tuple[int, ...] | "Color") -> None:
@@ -46,6 +195,40 @@ class Color:
                 "value is not a valid color: value must be a string or Color()"
             )
 
+    @classmethod
+    def _from_rgba(cls, r: float, g: float, b: float, a: float) -> Color:
+        """
+        Build a color from normalized RGBA, without going through a parser.
+
+        Args:
+            r (float): Red in [0.0, 1.0].
+            g (float): Green in [0.0, 1.0].
+            b (float): Blue in [0.0, 1.0].
+            a (float): Alpha in [0.0, 1.0].
+
+        Returns:
+            Color: New color.
+        """
+        color = cls.__new__(cls)
+        color._rgba = (r, g, b, a)
+        return color
+
+    @classmethod
+    def _from_hsva(cls, h: int, s: int, v: int, a: float) -> Color:
+        """
+        Build a color from integer HSV and alpha, same as parsing "hsva(...)".
+
+        Args:
+            h (int): Hue in degrees.
+            s (int): Saturation in percent.
+            v (int): Value in percent.
+            a (float): Alpha in [0.0, 1.0].
+
+        Returns:
+            Color: New color.
+        """
+        return cls._from_rgba(*_hsv_to_rgb(h, s, v), a)
+
     @staticmethod
     def _parse_rgb_tuple(value: tuple[int, ...]) -> tuple[float, float, float, float]:
         """
@@ -57,6 +240,8 @@ class Color:
         Returns:
             tuple[float, float, float, float]: (r, g, b, a) in [0.0, 1.0].
         """
+        # true division, not `* (1 / 255)`: the reciprocal rounds differently and
+        # int(x * 255) would no longer give back x for 24 of the 256 values
         r = value[0] / 255
         g = value[1] / 255
         b = value[2] / 255
@@ -65,10 +250,14 @@ class Color:
         return r, g, b, a
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _parse_str(value: str) -> tuple[float, float, float, float]:
         """
         Dispatch parser for hex/rgb(a)/hsl(a)/hsv(a) strings.
 
+        Results are cached: palettes and templates parse the same strings over
+        and over.
+
         Args:
             value (str): Color string.
 
@@ -117,15 +306,30 @@ class Color:
         Returns:
             tuple[float, float, float, float]: Normalized RGBA.
         """
-        value = value[1:]
-        parsed = tuple(int(value[i : i + 2], 16) / 255 for i in range(0, len(value), 2))
-
-        if len(parsed) == 4:
-            return parsed
-        elif len(parsed) == 3:
-            return parsed + (1.0,)
+        try:
+            raw = bytes.fromhex(value[1:])
+        except ValueError:
+            raw = b""
+
+        if len(raw) == 4:
+            return raw[0] / 255, raw[1] / 255, raw[2] / 255, raw[3] / 255
+        elif len(raw) == 3:
+            return raw[0] / 255, raw[1] / 255, raw[2] / 255, 1.0
         else:
-            raise ValueError("Invalid hex string format: {value}")
+            raise ValueError(f'Invalid hex string format: "{value}"')
+
+    @staticmethod
+    def _split_percent_args(value: str) -> list[str]:
+        """
+        Split the arguments of a "name(a, b%, c%[, d])" string.
+
+        Args:
+            value (str): Functional color string.
+
+        Returns:
+            list[str]: Arguments without spaces and "%" signs.
+        """
+        return [x.strip("% ") for x in value.partition("(")[2][:-1].split(",")]
 
     @staticmethod
     def _parse_hsl(value: str) -> tuple[float, float, float, float]:
@@ -138,8 +342,7 @@ class Color:
         Returns:
             tuple[float, float, float, float]: Normalized RGBA.
         """
-        value_string = value.split("(")[1][:-1]
-        values = [x.strip("% ") for x in value_string.split(",")]
+        values = Color._split_percent_args(value)
 
         h = int(values[0])
         s = int(values[1])
@@ -161,14 +364,13 @@ class Color:
         Returns:
             tuple[float, float, float, float]: Normalized RGBA.
         """
-        value_string = value.split("(")[1][:-1]
-        values = [x.strip("% ") for x in value_string.split(",")]
+        values = Color._split_percent_args(value)
 
         h = int(values[0])
         s = int(values[1])
         v = int(values[2])
 
-        r, g, b = colorsys.hsv_to_rgb(h / 360, s / 100, v / 100)
+        r, g, b = _hsv_to_rgb(h, s, v)
         a = (float(values[3])) if len(values) > 3 else 1.0
 
         return r, g, b, a
@@ -183,7 +385,7 @@ class Color:
         """
         return self._rgba[3]
 
-    @property
+    @_slot_cached_property
     def hex(self) -> str:
         """
         Hex string without alpha.
@@ -191,9 +393,9 @@ class Color:
         Returns:
             str: "#RRGGBB".
         """
-        return f"#{''.join(self.hex_tuple())}"
+        return f"#{self._rgba8 >> 8:06x}"
 
-    @property
+    @_slot_cached_property
     def hexa(self) -> str:
         """
         Hex string with alpha.
@@ -201,7 +403,13 @@ class Color:
         Returns:
             str: "#RRGGBBAA".
         """
-        return f"#{''.join(self.hex_tuple(alpha=True))}"
+        return f"#{self._rgba8:08x}"
+
+    @_slot_cached_property
+    def _rgba8(self) -> int:
+        # 8 bits per channel packed as 0xRRGGBBAA, what hex strings are cut from
+        r, g, b, a = self._rgba
+        return _to_byte(r) << 24 | _to_byte(g) << 16 | _to_byte(b) << 8 | _to_byte(a)
 
     @property
     def nohash(self) -> str:
@@ -233,10 +441,9 @@ class Color:
         Returns:
             tuple[str, ...]: ("rr", "gg", "bb"[, "aa"]).
         """
-        return tuple(
-            f"{hex(int(x * 255))[2:]:0>2}"
-            for x in (self._rgba if alpha else self._rgba[:3])
-        )
+        r, g, b, a = self._rgba
+        rgb = (f"{_to_byte(r):02x}", f"{_to_byte(g):02x}", f"{_to_byte(b):02x}")
+        return (*rgb, f"{_to_byte(a):02x}") if alpha else rgb
 
     @property
     def rgb(self) -> str:
@@ -246,7 +453,8 @@ class Color:
         Returns:
             str: "rgb(r, g, b)".
         """
-        return f"rgb({', '.join([str(int(v * 255)) for v in self._rgba[:3]])})"
+        r, g, b, _ = self._rgba
+        return f"rgb({_to_byte(r)}, {_to_byte(g)}, {_to_byte(b)})"
 
     @property
     def rgba(self) -> str:
@@ -256,7 +464,8 @@ class Color:
         Returns:
             str: "rgba(r, g, b, a)".
         """
-        return f"rgba({', '.join([str(int(v * 255)) for v in self._rgba])})"
+        r, g, b, a = self._rgba
+        return f"rgba({_to_byte(r)}, {_to_byte(g)}, {_to_byte(b)}, {_to_byte(a)})"
 
     def rgb_tuple(self, alpha: bool = False) -> tuple[float, ...]:
         """
@@ -278,7 +487,7 @@ class Color:
         Returns:
             str: "hsl(h, s%, l%)".
         """
-        h, s, l = self.hsl_tuple()
+        h, s, l = self._hsl
         return f"hsl({int(h * 360)}, {int(s * 100)}%, {int(l * 100)}%)"
 
     @property
@@ -289,7 +498,8 @@ class Color:
         Returns:
             str: "hsla(h, s%, l%, a)".
         """
-        h, s, l, a = self.hsl_tuple(alpha=True)
+        h, s, l = self._hsl
+        a = self._rgba[3]
         return f"hsla({int(h * 360)}, {int(s * 100)}%, {int(l * 100)}%, {round(a, 2)})"
 
     def hsl_tuple(self, alpha: bool = False) -> tuple[float, ...]:
@@ -302,8 +512,12 @@ class Color:
         Returns:
             tuple[float, ...]: (h, s, l[, a]) in [0.0, 1.0].
         """
+        return (*self._hsl, self._rgba[3]) if alpha else self._hsl
+
+    @_slot_cached_property
+    def _hsl(self) -> tuple[float, float, float]:
         h, l, s = colorsys.rgb_to_hls(*self._rgba[:3])
-        return (h, s, l, self._rgba[3]) if alpha else (h, s, l)
+        return h, s, l
 
     @property
     def hsv(self) -> str:
@@ -313,7 +527,7 @@ class Color:
         Returns:
             str: "hsv(h, s%, v%)".
         """
-        h, s, v = self.hsv_tuple()
+        h, s, v = self._hsv
         return f"hsv({int(h * 360)}, {int(s * 100)}%, {int(v * 100)}%)"
 
     @property
@@ -324,7 +538,8 @@ class Color:
         Returns:
             str: "hsva(h, s%, v%, a)".
         """
-        h, s, v, a = self.hsv_tuple(alpha=True)
+        h, s, v = self._hsv
+        a = self._rgba[3]
         return f"hsva({int(h * 360)}, {int(s * 100)}%, {int(v * 100)}%, {round(a, 2)})"
 
     def hsv_tuple(self, alpha: bool = False) -> tuple[float, ...]:
@@ -337,8 +552,11 @@ class Color:
         Returns:
             tuple[float, ...]: (h, s, v[, a]) in [0.0, 1.0].
         """
-        h, s, v = colorsys.rgb_to_hsv(*self._rgba[:3])
-        return (h, s, v, self._rgba[3]) if alpha else (h, s, v)
+        return (*self._hsv, self._rgba[3]) if alpha else self._hsv
+
+    @_slot_cached_property
+    def _hsv(self) -> tuple[float, float, float]:
+        return _rgb_to_hsv(*self._rgba[:3])
 
     def contrasting(self, base: Color | None = None, val_delta: int = 75) -> Color:
         """
@@ -366,9 +584,7 @@ class Color:
             else:
                 v = max(v - delta, 0.0)
 
-        return Color(
-            f"hsva({int(h * 360)}, {int(s * 100)}%, {int(v * 100)}%, {round(a, 2)})"
-        )
+        return Color._from_hsva(int(h * 360), int(s * 100), int(v * 100), round(a, 2))
 
     def adjusted(
         self,
@@ -405,47 +621,24 @@ class Color:
         Returns:
             Color: Adjusted color.
         """
-
-        def _adjust(
-            value: int,
-            adjustment: int | str | None,
-            min_val: int | None,
-            max_val: int | None,
-            wrap_basis: int | None = None,
-        ) -> int:
-            if isinstance(adjustment, str):
-                if adjustment.startswith("+"):
-                    value += int(adjustment[1:])
-                elif adjustment.startswith("-"):
-                    value -= int(adjustment[1:])
-                else:
-                    raise ValueError(f'invalid adjustment format: "{adjustment}"')
-            elif isinstance(adjustment, int):
-                value = adjustment
-
-            if min_val is not None:
-                value = max(min_val, value)
-            if max_val is not None:
-                value = min(max_val, value)
-
-            if wrap_basis:
-                value %= wrap_basis
-                return max(0, min(wrap_basis, value))
-            else:
-                return max(0, min(100, value))
-
         h, s, v, a = self.hsv_tuple(alpha=True)
-        h = _adjust(int(h * 360), hue, min_hue, max_hue, 360)
-        s = _adjust(int(s * 100), sat, min_sat, max_sat)
-        v = _adjust(int(v * 100), val, min_val, max_val)
-        a = _adjust(int(a * 100), alpha, min_alpha, max_alpha) / 100
+        h = _adjust_channel(int(h * 360), hue, min_hue, max_hue, 360)
+        s = _adjust_channel(int(s * 100), sat, min_sat, max_sat)
+        v = _adjust_channel(int(v * 100), val, min_val, max_val)
+        a = _adjust_channel(int(a * 100), alpha, min_alpha, max_alpha) / 100
 
-        clr = Color(f"hsva({h}, {s}%, {v}%, {a})")
-        return clr
+        return Color._from_hsva(h, s, v, a)
 
     def copy(self) -> "Color":
         return Color(self)
 
+    # colors are immutable, copies can share the instance
+    def __copy__(self) -> "Color":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Color":
+        return self
+
     def __str__(self) -> str:
         return self.hex
 
@@ -453,7 +646,12 @@ class Color:
         return f"Color({self.hex})"
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Color) and self._rgba == other._rgba
+        if other is self:
+            return True
+        return type(other) is Color and self._rgba == other._rgba
+
+    def __hash__(self) -> int:
+        return hash(self._rgba)
 
     @classmethod
     def __get_pydantic_json_schema__(
@@ -473,6 +671,9 @@ class Color:
 
     @classmethod
     def _validate(cls, __input_value: Any, _: Any) -> Color:
+        # colors are never mutated, an existing one can be shared as is
+        if type(__input_value) is cls:
+            return __input_value
         return cls(__input_value)
 
 
@@ -516,22 +717,42 @@ class GlobalPalette(Palette):
     path: SkipJsonSchema[Path | None] = Field(default=None, exclude=True)
 
 
+# palette file -> (mtime_ns, parsed palette)
+_palettes_cache: dict[Path, tuple[int, GlobalPalette]] = {}
+
+
+def _load_palette(file: Path) -> GlobalPalette | None:
+    try:
+        mtime = file.stat().st_mtime_ns
+        cached = _palettes_cache.get(file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        palette = GlobalPalette(name=file.stem, path=file, **load_json(file))
+        _palettes_cache[file] = (mtime, palette)
+        return palette
+    except Exception as e:
+        log.exception(e)
+        log.error(f'Failed to load palette "{file.stem}"')
+        return None
+
+
 def get_palettes() -> dict[str, GlobalPalette]:
-    palettes = {}
+    palettes: dict[str, GlobalPalette] = {}
     for file in PALETTES_DIR.iterdir():
-        try:
-            palette = load_json(file)
-            palettes[file.stem] = GlobalPalette(name=file.stem, path=file, **palette)
-        except Exception as e:
-            log.exception(e)
-            log.error(f'Failed to load palette "{file.stem}"')
+        if palette := _load_palette(file):
+            palettes[file.stem] = palette
     return palettes
 
 
 def palette_display_string(colors: Any) -> str:
     circles = []
     for i in range(16):
-        circles.append(f"[{Color(colors[f'color{i}']).hex}]🔘[/]")
+        color = colors[f"color{i}"]
+        # Colors already carry a cached hex, only strings need parsing
+        if not isinstance(color, Color):
+            color = Color(color)
+        circles.append(f"[{color.hex}]🔘[/]")
 
     palette_string = " ".join(circles[0:8]) + "\r\n" + " ".join(circles[8:])
 
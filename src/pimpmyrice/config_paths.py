@@ -82,6 +82,7 @@ SERVER_PID_FILE = PIMP_RUNTIME_DIR / "server.pid"
 # Cache / logs
 TEMP_DOWNLOADS_DIR = PIMP_CACHE_DIR / "downloads"
 THUMBNAILS_DIR = PIMP_CACHE_DIR / "thumbnails"
+EXTRACTED_COLORS_DIR = PIMP_CACHE_DIR / "extracted_colors"
 LOGS_DIR = PIMP_CACHE_DIR / "logs"
 
 # Remote repos
@@ -3,6 +3,7 @@ import logging
 import mimetypes
 import os
 import shutil
+import tempfile
 from importlib import resources
 from pathlib import Path
 from typing import Any
@@ -13,6 +14,7 @@ from pimpmyrice import assets
 from pimpmyrice.config_paths import (
     BASE_STYLE_FILE,
     CONFIG_FILE,
+    EXTRACTED_COLORS_DIR,
     JSON_SCHEMA_DIR,
     LOGS_DIR,
     MODULES_DIR,
@@ -28,6 +30,51 @@ from pimpmyrice.config_paths import (
 
 log = logging.getLogger(__name__)
 
+# libyaml-backed equivalents of yaml.Loader/yaml.Dumper when available
+try:
+    from yaml import CDumper as _YamlDumper
+    from yaml import CLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import Dumper as _YamlDumper
+    from yaml import Loader as _YamlLoader
+
+
+# process umask, to give new files the mode a plain open() would
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_atomic(file: Path, text: str) -> None:
+    """
+    Write text to a file through a unique temporary sibling and an atomic rename.
+
+    Symlinks are resolved first so the link itself is preserved, and an existing
+    target's permission bits are kept. The data is fsynced before the rename.
+
+    Args:
+        file (Path): Output path.
+        text (str): Content to write.
+
+    Returns:
+        None
+    """
+    target = file.resolve()
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if target.exists():
+            shutil.copymode(target, tmp)
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
 
 def load_yaml(file: Path) -> dict[str, Any]:
     """
@@ -40,7 +87,7 @@ def load_yaml(file: Path) -> dict[str, Any]:
         dict[str, Any]: Parsed data.
     """
     with open(file, encoding="utf-8") as f:
-        data = yaml.load(f, Loader=yaml.Loader)
+        data = yaml.load(f, Loader=_YamlLoader)
         if data is None:
             data = {}
 
@@ -61,15 +108,14 @@ def save_yaml(file: Path, data: dict[str, Any]) -> None:
     Returns:
         None
     """
-    dump = yaml.dump(data, indent=4, default_flow_style=False)
+    dump = yaml.dump(data, indent=4, default_flow_style=False, Dumper=_YamlDumper)
 
     schema_file = JSON_SCHEMA_DIR / f"{file.stem}.json"
     if schema_file.exists():
         schema_str = f"# yaml-language-server: $schema={schema_file}\n\n"
         dump = schema_str + dump
 
-    with open(file, "w", encoding="utf-8") as f:
-        f.write(dump)
+    _write_atomic(file, dump)
 
 
 def load_json(file: Path) -> dict[str, Any]:
@@ -110,8 +156,7 @@ def save_json(file: Path, data: dict[str, Any]) -> None:
     if schema_file.exists():
         data["$schema"] = os.path.relpath(schema_file, file.parent)
 
-    with open(file, "w", encoding="utf-8") as f:
-        f.write(dump)
+    _write_atomic(file, dump)
 
 
 def import_image(image_path: Path, theme_dir: Path) -> Path:
@@ -157,6 +202,7 @@ def create_config_dirs() -> None:
         JSON_SCHEMA_DIR,
         TEMP_DOWNLOADS_DIR,
         THUMBNAILS_DIR,
+        EXTRACTED_COLORS_DIR,
         LOGS_DIR,
     ]:
         dir.mkdir(exist_ok=True, parents=True)
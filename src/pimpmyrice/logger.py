@@ -21,12 +21,13 @@ class ContextFilter(logging.Filter):
 class ModuleFormatter(logging.Formatter):
     """Formatter that prefixes messages with module name when available."""
 
+    _plain = logging.Formatter("%(message)s")
+    _with_module = logging.Formatter("[%(module_name)s] %(message)s")
+
     def format(self, record: logging.LogRecord) -> str:
-        base_format = "%(message)s"
-        if hasattr(record, "module_name") and record.module_name:
-            base_format = f"[%(module_name)s] {base_format}"
-        formatter = logging.Formatter(base_format)
-        return formatter.format(record)
+        if getattr(record, "module_name", None):
+            return self._with_module.format(record)
+        return self._plain.format(record)
 
 
 def serialize_logrecord(log_record: logging.LogRecord) -> str:
@@ -13,6 +13,15 @@ from typing import Any
 
 log = logging.getLogger(__name__)
 
+# old action list key -> on_events name
+_EVENT_KEY_MAP = {
+    "init": "module_install",
+    "pre_run": "before_theme_apply",
+    "run": "theme_apply",
+}
+
+_DOT_TO_SLASH = str.maketrans(".", "/")
+
 
 def _has_old_syntax(data: dict[str, Any]) -> bool:
     """Check if module data uses pre-0.5.0 syntax."""
@@ -26,18 +35,23 @@ def _is_init_action(action: dict[str, Any]) -> bool:
 
 
 def _migrate_python_action(action: dict[str, Any], module_name: str) -> dict[str, Any]:
-    """Migrate old PythonAction syntax to new syntax."""
-    if "function" in action and "py_file_path" not in action:
-        func = action.pop("function")
-        if "." in func:
-            parts = func.rsplit(".", 1)
-            action["py_file_path"] = parts[0].replace(".", "/") + ".py"
-            action["function_name"] = parts[1]
-        else:
-            action["py_file_path"] = f"{module_name}.py"
-            action["function_name"] = func
-        action["action"] = "python"
-    return action
+    """Migrate old PythonAction syntax to new syntax, returning a new dict."""
+    func = action.get("function")
+    if func is None or "py_file_path" in action:
+        return action
+
+    if "." in func:
+        head, _, function_name = func.rpartition(".")
+        py_file_path = head.translate(_DOT_TO_SLASH) + ".py"
+    else:
+        py_file_path = f"{module_name}.py"
+        function_name = func
+
+    return {k: v for k, v in action.items() if k != "function"} | {
+        "py_file_path": py_file_path,
+        "function_name": function_name,
+        "action": "python",
+    }
 
 
 def migrate_module_dict(data: dict[str, Any]) -> dict[str, Any] | None:
@@ -56,52 +70,45 @@ def migrate_module_dict(data: dict[str, Any]) -> dict[str, Any] | None:
         return None
 
     migrated: dict[str, Any] = {}
+    # keep handlers of modules already partially on the new syntax
+    on_events: dict[str, Any] = dict(data.get("on_events") or {})
     module_name = data.get("name", "")
 
-    def convert_actions(actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def convert_actions(
+        actions: list[dict[str, Any]], python_default: bool = False
+    ) -> list[dict[str, Any]]:
         converted = []
         for action in actions:
+            # old commands could omit action="python" when they had a "function"
+            if python_default and "function" in action and "action" not in action:
+                action = {**action, "action": "python"}
             if action.get("action") == "python":
                 action = _migrate_python_action(action, module_name)
             converted.append(action)
         return converted
 
     for key, value in data.items():
-        if key == "name":
-            continue
-        if key in ("enabled", "os"):
-            migrated[key] = value
+        if key in ("name", "on_events"):
             continue
 
-        if key == "init":
-            on_events = migrated.setdefault("on_events", {})
-            on_events["module_install"] = convert_actions(value)
-
-        elif key == "pre_run":
-            on_events = migrated.setdefault("on_events", {})
-            on_events["before_theme_apply"] = convert_actions(value)
-
-        elif key == "run":
-            on_events = migrated.setdefault("on_events", {})
-            on_events["theme_apply"] = convert_actions(value)
+        event = _EVENT_KEY_MAP.get(key)
+        if event is not None:
+            on_events[event] = [*(on_events.get(event) or []), *convert_actions(value)]
 
         elif key == "commands":
-            migrated["scripts"] = {}
-            for script_name, script_value in value.items():
-                # Handle both single action dict and list of actions
-                if isinstance(script_value, list):
-                    actions = script_value
-                else:
-                    actions = [script_value]
-
-                # Add action="python" to each action that has "function"
-                for action in actions:
-                    if "function" in action and "action" not in action:
-                        action["action"] = "python"
-
-                migrated["scripts"][script_name] = convert_actions(actions)
+            # scripts can be a single action dict or a list of actions
+            migrated["scripts"] = {
+                script_name: convert_actions(
+                    script_value if isinstance(script_value, list) else [script_value],
+                    python_default=True,
+                )
+                for script_name, script_value in value.items()
+            }
 
         else:
             migrated[key] = value
 
+    if on_events:
+        migrated["on_events"] = on_events
+
     return migrated
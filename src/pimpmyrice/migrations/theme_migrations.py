@@ -12,41 +12,47 @@ from typing import Any
 
 log = logging.getLogger(__name__)
 
+_OLD_REF_SUB = re.compile(r"\$([a-zA-Z_][a-zA-Z0-9_]*)")
 
-def _has_old_syntax(data: dict[str, Any]) -> bool:
-    """Check if data contains $var references (not {{...}})."""
-    old_ref_pattern = re.compile(r"\$[a-zA-Z_][a-zA-Z0-9_]*")
-
-    def contains_old_ref(value: Any) -> bool:
-        if isinstance(value, str):
-            if "{{" in value and "}}" in value:
-                return False
-            return bool(old_ref_pattern.search(value))
-        elif isinstance(value, dict):
-            return any(contains_old_ref(v) for v in value.values())
-        elif isinstance(value, list):
-            return any(contains_old_ref(v) for v in value)
-        return False
-
-    return contains_old_ref(data)
-
-
-def _convert_refs_recursively(value: Any) -> Any:
-    """Convert $var references to {{var}} in values."""
-    if isinstance(value, str):
-        if "{{" in value and "}}" in value:
-            return value
-        return re.sub(r"\$([a-zA-Z_][a-zA-Z0-9_]*)", r"{{\1}}", value)
-    elif isinstance(value, dict):
-        return {k: _convert_refs_recursively(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [_convert_refs_recursively(item) for item in value]
-    return value
+
+def _convert_str(value: str) -> tuple[str, int]:
+    """Convert $var references to {{var}} in a string, with the rewrite count."""
+    if "$" not in value or ("{{" in value and "}}" in value):
+        return value, 0
+    return _OLD_REF_SUB.subn(r"{{\1}}", value)
+
+
+def _convert_refs_inplace(containers: list[Any]) -> bool:
+    """
+    Convert $var references to {{var}} in place, in the given dicts/lists.
+
+    Iterative, and only strings that actually change are written back.
+
+    Args:
+        containers: Dicts and lists to rewrite, with everything nested in them.
+
+    Returns:
+        Whether anything was rewritten.
+    """
+    changed = False
+    stack = containers
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                converted, count = _convert_str(value)
+                if count:
+                    node[key] = converted
+                    changed = True
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return changed
 
 
 def migrate_theme_dict(data: dict[str, Any]) -> dict[str, Any] | None:
     """
-    Migrate theme data from $var to {{var}} syntax.
+    Migrate theme data from $var to {{var}} syntax, in place.
 
     Returns migrated data if old syntax detected, None if already current.
 
@@ -56,28 +62,27 @@ def migrate_theme_dict(data: dict[str, Any]) -> dict[str, Any] | None:
     Returns:
         Migrated dict or None if no migration needed.
     """
-    if not _has_old_syntax(data):
-        return None
-
-    migrated: dict[str, Any] = {}
+    # modes are only rewritten inside their dicts
+    containers: list[Any] = []
+    changed = False
     for key, value in data.items():
         if key == "modes":
-            migrated[key] = {}
-            for mode_name, mode_data in value.items():
-                if isinstance(mode_data, dict):
-                    migrated[key][mode_name] = {
-                        k: _convert_refs_recursively(v) for k, v in mode_data.items()
-                    }
-                else:
-                    migrated[key][mode_name] = mode_data
-        else:
-            migrated[key] = _convert_refs_recursively(value)
-    return migrated
+            containers.extend(m for m in value.values() if isinstance(m, dict))
+        elif isinstance(value, str):
+            converted, count = _convert_str(value)
+            if count:
+                data[key] = converted
+                changed = True
+        elif isinstance(value, (dict, list)):
+            containers.append(value)
+
+    changed = _convert_refs_inplace(containers) or changed
+    return data if changed else None
 
 
 def migrate_style_dict(data: dict[str, Any]) -> dict[str, Any] | None:
     """
-    Migrate style data from $var to {{var}} syntax.
+    Migrate style data from $var to {{var}} syntax, in place.
 
     Returns migrated data if old syntax detected, None if already current.
 
@@ -87,10 +92,4 @@ def migrate_style_dict(data: dict[str, Any]) -> dict[str, Any] | None:
     Returns:
         Migrated dict or None if no migration needed.
     """
-    if not _has_old_syntax(data):
-        return None
-
-    migrated: dict[str, Any] = {}
-    for key, value in data.items():
-        migrated[key] = _convert_refs_recursively(value)
-    return migrated
+    return data if _convert_refs_inplace([data]) else None
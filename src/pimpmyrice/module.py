@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+from collections import Counter
 from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -28,6 +30,22 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _save_module(module: Module, module_dir: Path | None = None) -> None:
+    """
+    Serialize a module once and write its cleaned manifest to `module.yaml`.
+
+    Args:
+        module (Module): Module to save.
+        module_dir (Path | None): Module directory. Defaults to
+            `MODULES_DIR / module.name`.
+
+    Returns:
+        None
+    """
+    dump = clean_module_dump(module.model_dump(mode="json"))
+    save_yaml((module_dir or MODULES_DIR / module.name) / "module.yaml", dump)
+
+
 class ModuleManager:
     """
     Manage discovery, lifecycle, and execution of modules.
@@ -49,8 +67,11 @@ class ModuleManager:
         """
         timer = Timer()
 
-        for module_dir in MODULES_DIR.iterdir():
-            if not module_dir.is_dir() or not (
+        with os.scandir(MODULES_DIR) as it:
+            module_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+
+        for module_dir in module_dirs:
+            if not (
                 (module_dir / "module.yaml").exists()
                 or (module_dir / "module.json").exists()
             ):
@@ -117,20 +138,25 @@ class ModuleManager:
             theme_runners = []
             after_runners = []
 
+            include = set(include_modules or ())
+            exclude = set(exclude_modules or ())
+
             for module_name, module in self.modules.items():
                 if (
-                    (include_modules and module_name not in include_modules)
-                    or (exclude_modules and module_name in exclude_modules)
+                    (include and module_name not in include)
+                    or module_name in exclude
                     or not module.enabled
                 ):
                     modules_state[module_name] = ModuleState.SKIPPED
                     continue
 
+                events = module.on_events
+
                 # Check if module has any lifecycle actions
                 has_actions = (
-                    module.on_events.before_theme_apply
-                    or module.on_events.theme_apply
-                    or module.on_events.after_theme_apply
+                    events.before_theme_apply
+                    or events.theme_apply
+                    or events.after_theme_apply
                 )
                 if not has_actions:
                     modules_state[module_name] = ModuleState.SKIPPED
@@ -138,11 +164,11 @@ class ModuleManager:
 
                 modules_state[module_name] = ModuleState.PENDING
 
-                if module.on_events.before_theme_apply:
+                if events.before_theme_apply:
                     before_runners.append(module_name)
-                if module.on_events.theme_apply:
+                if events.theme_apply:
                     theme_runners.append(module_name)
-                if module.on_events.after_theme_apply:
+                if events.after_theme_apply:
                     after_runners.append(module_name)
 
             if (
@@ -157,18 +183,19 @@ class ModuleManager:
             # Stage 1: before_theme_apply (sequential, transforms theme_dict)
             log.debug(f"running before_theme_apply for {len(before_runners)} modules")
             for name in before_runners:
+                module = self.modules[name]
                 mod_res = await module_context_wrapper(
                     name,
                     modules_state,
-                    self.modules[name].execute_before_theme_apply(deepcopy(theme_dict)),
+                    module.execute_before_theme_apply(deepcopy(theme_dict)),
                 )
                 if mod_res and isinstance(mod_res, AttrDict):
                     theme_dict = mod_res
 
                 modules_state[name] = (
                     ModuleState.RUNNING
-                    if self.modules[name].on_events.theme_apply
-                    or self.modules[name].on_events.after_theme_apply
+                    if module.on_events.theme_apply
+                    or module.on_events.after_theme_apply
                     else ModuleState.COMPLETED
                 )
 
@@ -185,12 +212,15 @@ class ModuleManager:
                 for name in theme_runners
             ]
 
-            for t in asyncio.as_completed(theme_tasks):
-                try:
-                    await t
-                except Exception as e:
-                    log.debug("exception:", exc_info=e)
-                    log.error(str(e))
+            # module_context_wrapper already logs module failures, this only
+            # catches errors escaping it without cancelling the other modules;
+            # cancellation and interrupts still propagate
+            for res in await asyncio.gather(*theme_tasks, return_exceptions=True):
+                if isinstance(res, Exception):
+                    log.debug("exception:", exc_info=res)
+                    log.error(str(res))
+                elif isinstance(res, BaseException):
+                    raise res
 
             # Stage 3: after_theme_apply (sequential after theme_apply)
             log.debug(f"running after_theme_apply for {len(after_runners)} modules")
@@ -204,15 +234,10 @@ class ModuleManager:
                 )
 
             # Final state accounting
-            completed = skipped = failed = 0
-            for state in modules_state.values():
-                match state:
-                    case ModuleState.COMPLETED:
-                        completed += 1
-                    case ModuleState.SKIPPED:
-                        skipped += 1
-                    case ModuleState.FAILED:
-                        failed += 1
+            counts = Counter(modules_state.values())
+            completed = counts[ModuleState.COMPLETED]
+            skipped = counts[ModuleState.SKIPPED]
+            failed = counts[ModuleState.FAILED]
 
             log.info(
                 f"{len(self.modules)} modules finished in {timer.elapsed:.2f} sec: "
@@ -265,14 +290,18 @@ class ModuleManager:
         Returns:
             None
         """
-        for module in self.modules.values():
-            if name_includes and name_includes not in module.name:
-                continue
-
-            dump = module.model_dump(mode="json")
-            dump = clean_module_dump(dump)
+        modules = [
+            module
+            for module in self.modules.values()
+            if not name_includes or name_includes in module.name
+        ]
+
+        # manifests are independent, write them concurrently
+        await asyncio.gather(
+            *(asyncio.to_thread(_save_module, module) for module in modules)
+        )
 
-            save_yaml(MODULES_DIR / module.name / "module.yaml", dump)
+        for module in modules:
             log.info(f'module "{module.name}" rewritten')
 
     async def create_module(self, module_name: str) -> None:
@@ -323,9 +352,7 @@ class ModuleManager:
         (module_path / "templates").mkdir()
         (module_path / "files").mkdir()
 
-        dump = module.model_dump(mode="json")
-        dump = clean_module_dump(dump)
-        save_yaml(module_path / "module.yaml", dump)
+        _save_module(module, module_path)
 
         with open(module_path / "apply.py", "w", encoding="utf-8") as f:
             f.write(
@@ -442,9 +469,7 @@ class ModuleManager:
             return
 
         module.enabled = enabled
-        dump = module.model_dump(mode="json")
-        dump = clean_module_dump(dump)
-        save_yaml(MODULES_DIR / module.name / "module.yaml", dump)
+        _save_module(module)
         status = "enabled" if enabled else "disabled"
         log.info(f'module "{module_name}" {status}')
 
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from functools import partial
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Awaitable, Coroutine, Literal, Union
 from uuid import uuid4
 
@@ -222,15 +223,31 @@ class FileAction(BaseModel):
             else:
                 target = out_dir / target
 
-        if not target.parent.exists():
-            target.parent.mkdir(parents=True, exist_ok=True)
+        # render and write off the event loop, other modules keep running
+        await asyncio.to_thread(_render_to_file, template, target, theme_dict)
 
-        processed_data = render_template_file(template, theme_dict)
+        log.debug(f'generated "{target}"')
 
-        with open(target, "w", encoding="utf-8") as f:
-            f.write(processed_data)
 
-        log.debug(f'generated "{target}"')
+def _render_to_file(template: Path, target: Path, theme_dict: AttrDict) -> None:
+    """
+    Render a template file and write the result to `target`.
+
+    Args:
+        template (Path): Template file path.
+        target (Path): Output file path.
+        theme_dict (AttrDict): Theme dictionary used for rendering.
+
+    Returns:
+        None
+    """
+    if not target.parent.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+    processed_data = render_template_file(template, theme_dict)
+
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(processed_data)
 
 
 class PythonAction(BaseModel):
@@ -633,10 +650,16 @@ class Module(BaseModel):
                 await action.run(theme_dict)
 
 
+# python file -> (mtime_ns, executed module)
+_py_modules_cache: dict[Path, tuple[int, ModuleType]] = {}
+
+
 def get_func_from_py_file(py_file: Path, func_name: str) -> Any:
     """
     Load a function object by name from a Python file.
 
+    The file is executed once and reused until its mtime changes.
+
     Args:
         py_file (Path): Path to the Python source file.
         func_name (str): Function name to retrieve.
@@ -644,11 +667,19 @@ def get_func_from_py_file(py_file: Path, func_name: str) -> Any:
     Returns:
         Any: Loaded function object.
     """
-    spec = importlib.util.spec_from_file_location(f"pimp_imported_{py_file}", py_file)
-    if not spec or not spec.loader:
-        raise ImportError(f'could not load "{py_file}"')
-    py_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(py_module)
+    mtime = py_file.stat().st_mtime_ns
+    cached = _py_modules_cache.get(py_file)
+    if cached and cached[0] == mtime:
+        py_module = cached[1]
+    else:
+        spec = importlib.util.spec_from_file_location(
+            f"pimp_imported_{py_file}", py_file
+        )
+        if not spec or not spec.loader:
+            raise ImportError(f'could not load "{py_file}"')
+        py_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(py_module)
+        _py_modules_cache[py_file] = (mtime, py_module)
 
     func = getattr(py_module, func_name)
 
@@ -756,7 +787,7 @@ async def clone_from_folder(source: Path, out_dir: Path = MODULES_DIR) -> str:
     if dest_dir.exists():
         raise Exception(f'module "{name}" already present')
 
-    shutil.copytree(source, MODULES_DIR / name)
+    await asyncio.to_thread(shutil.copytree, source, MODULES_DIR / name)
     return name
 
 
@@ -0,0 +1,18 @@
+from pimpmyrice.colors import Color
+
+
+def sort_by_vibrancy(colors_with_count: list[tuple[Color, int]]) -> list[Color]:
+    """
+    Sort extracted colors from most to least vibrant (saturation + value).
+
+    Args:
+        colors_with_count (list[tuple[Color, int]]): Colors and their counts.
+
+    Returns:
+        list[Color]: Colors, most vibrant first.
+    """
+    return sorted(
+        [color for color, count in colors_with_count],
+        key=lambda c: sum(c.hsv_tuple()[1:]),
+        reverse=True,
+    )
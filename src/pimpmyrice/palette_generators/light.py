@@ -1,7 +1,8 @@
+import asyncio
 from pathlib import Path
 
-from pimpmyrice.color_extract import extract_colors
 from pimpmyrice.colors import Color, Palette
+from pimpmyrice.palette_generators import sort_by_vibrancy
 
 
 async def gen_palette(image_path: Path) -> Palette:
@@ -14,14 +15,14 @@ async def gen_palette(image_path: Path) -> Palette:
     Returns:
         Palette: Palette emphasizing lighter backgrounds and vivid accents.
     """
-    colors_with_count = extract_colors(image_path)
+    # numpy and Pillow are only needed here, keep them off the startup path
+    from pimpmyrice.color_extract import extract_colors
+
+    # decoding and clustering are blocking, keep them off the event loop
+    colors_with_count = await asyncio.to_thread(extract_colors, image_path)
     # TODO use count
 
-    by_vibrancy = sorted(
-        [color for color, count in colors_with_count],
-        key=lambda c: c.hsv_tuple()[1] + (c.hsv_tuple()[2]),
-        reverse=True,
-    )
+    by_vibrancy = sort_by_vibrancy(colors_with_count)
 
     normal = colors_with_count[0][0].adjusted(max_sat=10, min_val=95)
 
@@ -46,11 +47,12 @@ async def gen_palette(image_path: Path) -> Palette:
     for i in range(8, 15):
         term[f"color{i}"] = term[f"color{i - 8}"].adjusted(sat="-50", val="+10")
 
-    term["color15"] = normal.contrasting().adjusted(max_sat=20)
+    normal_fg = normal.contrasting().adjusted(max_sat=20)
+    term["color15"] = normal_fg
 
     palette = {
         "term": term,
-        "normal": {"bg": normal, "fg": normal.contrasting().adjusted(max_sat=20)},
+        "normal": {"bg": normal, "fg": normal_fg},
         "primary": {"bg": primary, "fg": primary.contrasting()},
         "secondary": {"bg": secondary, "fg": secondary.contrasting()},
     }
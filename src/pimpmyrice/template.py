@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,23 @@ from pimpmyrice.config_paths import (
 )
 from pimpmyrice.exceptions import ReferenceNotFound
 
+_string_env = jinja2.Environment(undefined=jinja2.StrictUndefined)
+
+
+@lru_cache(maxsize=1024)
+def _compile_string(template: str) -> jinja2.Template:
+    """Compile a template string once; the same strings recur on every apply."""
+    return _string_env.from_string(template)
+
+
+@lru_cache(maxsize=64)
+def _file_env(search_paths: tuple[str, ...]) -> jinja2.Environment:
+    """Shared environment per search path, its loader caches compiled files."""
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(searchpath=list(search_paths)),
+        undefined=jinja2.StrictUndefined,
+    )
+
 
 def process_template(template: str, values: dict[str, Any]) -> str:
     """
@@ -25,7 +43,7 @@ def process_template(template: str, values: dict[str, Any]) -> str:
         str: Rendered string.
     """
     # get_template_keywords(template)
-    templ = jinja2.Environment(undefined=jinja2.StrictUndefined).from_string(template)
+    templ = _compile_string(template)
     rendered: str = templ.render(**values)
     return rendered
 
@@ -50,10 +68,7 @@ def render_template_file(
     if search_paths:
         fs_paths.extend(search_paths)
 
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(searchpath=[str(p) for p in fs_paths]),
-        undefined=jinja2.StrictUndefined,
-    )
+    env = _file_env(tuple(str(p) for p in fs_paths))
     templ = env.get_template(template_path.name)
     rendered: str = templ.render(**values)
     return rendered
@@ -81,9 +96,7 @@ def process_keyword_template(value: str, theme_map: dict[str, Any]) -> Any:
         output.append(v)
 
     template_str = "{%- set parsed = " + value[2:-2] + "-%} {{capture_j2_var(parsed)}}"
-    templ = jinja2.Environment(undefined=jinja2.StrictUndefined).from_string(
-        template_str
-    )
+    templ = _compile_string(template_str)
     templ.render(capture_j2_var=capture_j2_var, **theme_map)
 
     return output[0]
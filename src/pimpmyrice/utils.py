@@ -27,6 +27,9 @@ class Timer:
         return time.perf_counter() - self.start
 
 
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 class AttrDict(dict[str, Any]):
     """
     Dict allowing attribute accessing values using keys as attributes.
@@ -60,20 +63,45 @@ class AttrDict(dict[str, Any]):
             AttrDict: Merged copy.
         """
 
-        def merged(base: AttrDict, to_add: AttrDict) -> AttrDict:
-            base = deepcopy(base)
-            to_add = deepcopy(to_add)
+        def merge_into(base: AttrDict, to_add: dict[str, Any]) -> None:
             for k, v in to_add.items():
-                if isinstance(v, (dict, AttrDict)):
-                    if k in base:
-                        base[k] = merged(base[k], to_add[k])
-                    else:
-                        base[k] = to_add[k]
+                if isinstance(v, dict) and k in base:
+                    merge_into(base[k], v)
                 else:
                     base[k] = v
-            return base
 
-        return merged(self, AttrDict(other))
+        # copy both sides once, then merge in place
+        merged = deepcopy(self)
+        merge_into(merged, deepcopy(other))
+        return merged
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> AttrDict:
+        """
+        Deep-copy keeping attribute access and sharing immutable leaves.
+
+        Args:
+            memo (dict[int, Any]): `copy.deepcopy` memo.
+
+        Returns:
+            AttrDict: Copied dict.
+        """
+        return AttrDict._copy_tree(self, memo)
+
+    @staticmethod
+    def _copy_tree(src: dict[str, Any], memo: dict[int, Any]) -> AttrDict:
+        # register the returned AttrDict before recursing so shared subtrees
+        # stay shared, and nested dicts are copied straight into AttrDicts
+        copied = AttrDict()
+        memo[id(src)] = copied
+        for k, v in src.items():
+            if type(v) in _IMMUTABLE_TYPES:
+                pass
+            elif isinstance(v, dict):
+                v = memo[id(v)] if id(v) in memo else AttrDict._copy_tree(v, memo)
+            else:
+                v = deepcopy(v, memo)
+            dict.__setitem__(copied, k, v)
+        return copied
 
 
 DictOrAttrDict = TypeVar("DictOrAttrDict", dict[str, Any], AttrDict)
@@ -83,6 +111,8 @@ def is_process_running(name: str | None = None, pid: int | None = None) -> bool:
     """
     Check if a process is running by name or PID (mutually exclusive).
 
+    Name checks share a process list snapshot refreshed every half second.
+
     Args:
         name (str | None): Process name to look for.
         pid (int | None): Process ID to look for.
@@ -96,15 +126,40 @@ def is_process_running(name: str | None = None, pid: int | None = None) -> bool:
     if (not name and not pid) or (name and pid):
         raise Exception("provide either process pid or name")
 
-    attr = "name" if name else "pid"
-    val = name if name else pid
+    if name:
+        return name in _running_process_names()
 
-    for proc in psutil.process_iter([attr]):
-        if proc.info[attr] == val:
+    for proc in psutil.process_iter(["pid"]):
+        if proc.info["pid"] == pid:
             return True
     return False
 
 
+# process names snapshot shared by checks within a theme apply
+_PROCESS_NAMES_TTL = 0.5
+_process_names: tuple[float, frozenset[str]] = (float("-inf"), frozenset())
+
+
+def _running_process_names() -> frozenset[str]:
+    """
+    Names of running processes, rescanned at most every `_PROCESS_NAMES_TTL` sec.
+
+    Returns:
+        frozenset[str]: Process names.
+    """
+    global _process_names
+
+    now = time.monotonic()
+    if now - _process_names[0] > _PROCESS_NAMES_TTL:
+        names = frozenset(
+            proc.info["name"]
+            for proc in psutil.process_iter(["name"])
+            if proc.info["name"]
+        )
+        _process_names = (now, names)
+    return _process_names[1]
+
+
 def is_locked(lockfile: Path) -> tuple[bool, int]:
     """
     Determine whether a lockfile is held by a live process.
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from pimpmyrice.color_extract import kmeans
+
+
+@pytest.mark.parametrize("rgb", [(120, 120, 120), (255, 0, 0), (0, 0, 255)])
+def test_kmeans_lab_keeps_flat_color(rgb: tuple[int, int, int]) -> None:
+    pixels = np.full((64, 3), rgb, dtype=np.uint8)
+
+    [(center, count)] = kmeans(pixels, num_clusters=1, lab=True)
+
+    assert center == rgb
+    assert count == 64
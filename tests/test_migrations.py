@@ -0,0 +1,29 @@
+from pimpmyrice.migrations import migrate_module_dict
+
+
+def test_migrate_module_keeps_existing_on_events() -> None:
+    shell = {"action": "shell", "command": "echo new"}
+    old = {"action": "shell", "command": "echo old"}
+    data = {
+        "on_events": {"theme_applied": [shell], "theme_apply": [shell]},
+        "run": [old],
+    }
+
+    migrated = migrate_module_dict(data)
+
+    assert migrated is not None
+    assert migrated["on_events"] == {
+        "theme_applied": [shell],
+        "theme_apply": [shell, old],
+    }
+    assert "run" not in migrated
+
+
+def test_migrate_module_with_null_event() -> None:
+    old = {"action": "shell", "command": "echo old"}
+    data = {"on_events": {"theme_apply": None}, "run": [old]}
+
+    migrated = migrate_module_dict(data)
+
+    assert migrated is not None
+    assert migrated["on_events"] == {"theme_apply": [old]}